@@ -60,16 +60,17 @@ struct AVCTabView: View {
 
     // Convert hex string → Data
     let tokens = hexCommand.split(whereSeparator: \.isWhitespace)
+    var bytes: [UInt8] = []
     for token in tokens {
-      guard token.count == 2, token.allSatisfy({ $0.isHexDigit }) else {
+      guard token.count == 2, token.allSatisfy({ $0.isHexDigit }), let byte = UInt8(token, radix: 16) else {
         errorMessage = "Invalid hex format"
         return
       }
+      bytes.append(byte)
     }
-    let bytes = tokens.compactMap { UInt8($0, radix: 16) }
 
     if let resp = manager.sendCommand(guid: guid, command: Data(bytes)) {
-      responseHex = resp.map { String(format: "%02X", $0) }.joined(separator: " ")
+      responseHex = resp.hexString()
     } else {
       errorMessage = "No response or send failed"
     }
@@ -339,7 +339,7 @@ final class DeviceManager: ObservableObject {
             return nil
         }
         
-        logger.trace("Sending command to GUID 0x\(String(format: "%llX", guid)): \(command.map { String(format: "%02X", $0) }.joined())")
+        logger.trace("Sending command to GUID 0x\(String(format: "%llX", guid)): \(command.hexString(separator: ""))")
         
         var responseDataPtr: UnsafeMutablePointer<UInt8>? = nil
         var responseLen: Int = 0 // Corresponds to size_t in C
@@ -377,7 +377,7 @@ final class DeviceManager: ObservableObject {
         
         // Copy data and free C buffer
         let responseData = Data(bytes: buffer, count: Int(responseLen))
-        logger.trace("Received response from GUID 0x\(String(format: "%llX", guid)) (\(responseLen) bytes): \(responseData.map { String(format: "%02X", $0) }.joined())")
+        logger.trace("Received response from GUID 0x\(String(format: "%llX", guid)) (\(responseLen) bytes): \(responseData.hexString(separator: ""))")
         FWADevice_FreeResponseBuffer(buffer) // Free the C-allocated buffer
         
         return responseData
@@ -453,12 +453,23 @@ final class DeviceManager: ObservableObject {
             return
         }
         defer { FWADevice_FreeString(cJsonString) } // Ensure C string is freed
-        let jsonString = String(cString: cJsonString)
+        // Copy the C buffer once as raw bytes; the decoder reads these directly and the
+        // String is only kept for the cache check and the "Export JSON" action.
+        let jsonData = Data(bytes: cJsonString, count: strlen(cJsonString))
+        let jsonString = String(decoding: jsonData, as: UTF8.self)
+
+        // Skip decode + mapping when a connected device reported exactly the same JSON as last time.
+        // Re-assigning the published dictionaries would otherwise re-render every view. Devices
+        // marked offline always go through the mapping so a reconnect sets isConnected again.
+        if devices[guid]?.isConnected == true, deviceJsons[guid] == jsonString {
+            logger.debug("JSON unchanged for GUID 0x\(String(format: "%llX", guid)), keeping cached DeviceInfo.")
+            return
+        }
         deviceJsons[guid] = jsonString // Store original JSON
         
         // --- Step 2: Decode JSON string into intermediate `JsonDeviceData` ---
-        guard !jsonString.isEmpty, let jsonData = jsonString.data(using: .utf8) else {
-            logger.error("Failed to convert C JSON string to Data or string was empty for GUID 0x\(String(format: "%llX", guid)).")
+        guard !jsonData.isEmpty else {
+            logger.error("C JSON string was empty for GUID 0x\(String(format: "%llX", guid)).")
             devices.removeValue(forKey: guid) // Remove if JSON is fundamentally broken
             return
         }
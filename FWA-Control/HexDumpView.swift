@@ -4,7 +4,7 @@ struct HexDumpView: View {
     var data: Data
     var body: some View {
         ScrollView(.horizontal) {
-            Text(data.map { String(format: "%02X", $0) }.joined(separator: " "))
+            Text(data.hexString())
                 .font(.system(.body, design: .monospaced))
                 .padding(4)
                 .background(Color.gray.opacity(0.2))
@@ -12,3 +12,22 @@ struct HexDumpView: View {
         }
     }
 }
+
+private let hexDigits = Array("0123456789ABCDEF".utf8)
+
+extension Data {
+    /// Uppercase hex bytes joined by `separator`, e.g. "0A FF 10".
+    /// Builds the UTF-8 buffer directly instead of going through String(format:) per byte.
+    func hexString(separator: String = " ") -> String {
+        guard !isEmpty else { return "" }
+        let sep = Array(separator.utf8)
+        var out = [UInt8]()
+        out.reserveCapacity(count * (2 + sep.count))
+        for (i, byte) in enumerated() {
+            if i > 0 { out.append(contentsOf: sep) }
+            out.append(hexDigits[Int(byte >> 4)])
+            out.append(hexDigits[Int(byte & 0x0F)])
+        }
+        return String(decoding: out, as: UTF8.self)
+    }
+}
@@ -1,6 +1,7 @@
 // === FWA-Control/LogConsoleView.swift ===
 
 import SwiftUI
+import Combine
 import UniformTypeIdentifiers
 import Logging
 
@@ -33,15 +34,20 @@ struct LogConsoleView: View {
     @State private var isAutoScrollEnabled: Bool = true
     @State private var showExportSheet = false
     @State private var logExportContent: String = ""
+    // Cached result of the level/search filter. `body` reads this several times per render,
+    // so it is only rebuilt when the entries or the filter inputs actually change.
+    @State private var filteredLogs: [UILogEntry] = []
 
-    var filteredLogs: [UILogEntry] {
-        manager.uiLogEntries.filterBy { entry in
-            let levelMatch = entry.level >= selectedMinLevel
-            let searchMatch = searchText.isEmpty
-                          || entry.displayMessage.localizedCaseInsensitiveContains(searchText)
-                          || entry.level.rawValue.localizedCaseInsensitiveContains(searchText)
-                          || entry.source.localizedCaseInsensitiveContains(searchText)
-            return levelMatch && searchMatch
+    private func refilter(_ entries: [UILogEntry]) {
+        let minLevel = selectedMinLevel
+        let query = searchText
+        // Cheap level check first; only run the string searches on entries that pass it.
+        filteredLogs = entries.filterBy { entry in
+            guard entry.level >= minLevel else { return false }
+            guard !query.isEmpty else { return true }
+            return entry.level.rawValue.localizedCaseInsensitiveContains(query)
+                || entry.source.localizedCaseInsensitiveContains(query)
+                || entry.displayMessage.localizedCaseInsensitiveContains(query)
         }
     }
 
@@ -65,6 +71,20 @@ struct LogConsoleView: View {
                 .listStyle(.plain)
             }
         }
+        // DeviceManager appends one entry at a time (and publishes again when trimming), so
+        // coalesce bursts instead of refiltering the whole buffer for every log line.
+        .onReceive(
+            manager.$uiLogEntries
+                .throttle(for: .milliseconds(100), scheduler: RunLoop.main, latest: true)
+        ) { entries in
+            refilter(entries)
+        }
+        .onChange(of: selectedMinLevel) { _ in
+            refilter(manager.uiLogEntries)
+        }
+        .onChange(of: searchText) { _ in
+            refilter(manager.uiLogEntries)
+        }
         .fileExporter(
              isPresented: $showExportSheet,
              document: LogDocument(content: logExportContent),
@@ -144,21 +164,26 @@ struct LogConsoleView: View {
         }
     }
 
+    // Row styling is identical for every entry; build it once instead of per row.
+    private static let timestampFont = Font.system(size: 10, design: .monospaced)
+    private static let levelFont = Font.system(size: 10, design: .monospaced).weight(.semibold)
+    private static let messageFont = Font.system(size: 11, design: .monospaced)
+
     @ViewBuilder
     private func logEntryRow(_ entry: UILogEntry) -> some View {
         HStack(alignment: .top, spacing: 8) {
             Text(entry.timestamp, format: .dateTime.hour().minute().second().secondFraction(.fractional(3)))
-                .font(.system(size: 10, design: .monospaced))
+                .font(Self.timestampFont)
                 .foregroundColor(.secondary)
                 .frame(minWidth: 75, alignment: .leading)
 
             Text("[\(entry.level.rawValue.uppercased())]")
-                .font(.system(size: 10, design: .monospaced).weight(.semibold))
+                .font(Self.levelFont)
                 .foregroundColor(logColor(entry.level))
                 .frame(minWidth: 65, alignment: .leading)
 
             Text(entry.displayMessage)
-                .font(.system(size: 11, design: .monospaced))
+                .font(Self.messageFont)
                 .textSelection(.enabled)
                 .lineLimit(nil)
                 .layoutPriority(1)
@@ -227,6 +227,7 @@ private:
     // Future components (placeholders)
     std::unique_ptr<AudioClockPLL> pll_{nullptr};
     std::unique_ptr<class raul::RingBuffer> appRingBuffer_{nullptr};
+    std::vector<ProcessedAudioFrame> ringFrames_; // Per-packet staging for appRingBuffer_ writes
     
     // RunLoop reference
     CFRunLoopRef runLoopRef_{nullptr};
@@ -104,6 +104,8 @@ private:
      uint32_t sytPhase_{0}; // For 44.1kHz calculation
      bool firstDCLCallbackOccurred_{false};
      uint32_t expectedTimeStampCycle_{0}; // For timestamp checking
+     uint8_t sfc_{0x02}; // SFC for config_.sampleRate, resolved in initializeCIPState
+     uint8_t dbcIncrement_{0}; // Data blocks per DATA packet, resolved in initializeCIPState
 
     // Client Callbacks
     MessageCallback messageCallback_{nullptr};
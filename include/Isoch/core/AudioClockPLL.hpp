@@ -51,6 +51,8 @@ private:
     // Host timebase info
     mach_timebase_info_data_t timebaseInfo_{}; // For host clock info
     uint64_t hostTicksPerSecond_ = 0;          // Approx host ticks/sec
+    double hostTicksPerSampleNominal_ = 0.0;   // Host ticks per sample at targetSampleRate_
+    double fwTicksPerSampleNominal_ = 0.0;     // FW cycle timer ticks per sample at targetSampleRate_
 
     // Anchor points for timing correlation
     uint64_t initialHostTimeNano_ = 0;
@@ -83,6 +85,7 @@ private:
 
     // Helper methods
     void initializeHostClockInfo();
+    void updateDerivedRates();
     uint64_t absolute_to_nanoseconds(uint64_t mach_time) const;
     uint64_t nanoseconds_to_absolute(uint64_t nano_time) const;
 };
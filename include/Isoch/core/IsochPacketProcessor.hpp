@@ -115,6 +115,10 @@ private:
     bool sampleIndexInitialized_{false};
     uint32_t lastPacketNumDataBlocks_{0}; // Track number of blocks in the previous packet
     bool lastPacketWasNoData_{false}; // Track if the *immediately preceding* processed packet was NO_DATA
+    std::vector<ProcessedSample> packetSamples_; // Per-packet sample scratch, reused to avoid allocating on every packet
+
+    // Sends the zero-sample timing info the receiver uses to anchor its PLL on the first DATA packet
+    void signalPLLInit(uint32_t fwTimestamp, uint16_t syt, uint8_t dbc, uint8_t fdf, uint8_t sfc);
     
     /**
      * @brief Extract SFC (Sample Frequency Code) from FDF field
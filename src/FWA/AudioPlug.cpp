@@ -35,7 +35,9 @@ json AudioPlug::serializeConnectionInfo() const {
     std::stringstream ssStat;
     ssStat << "0x" << std::hex << std::setw(2) << std::setfill('0') << static_cast<int>(connectionInfo_->sourcePlugStatus);
     j_conn["sourcePlugStatus"] = ssStat.str();
-    spdlog::trace("  -> Serialized connectionInfo: {}", j_conn.dump());
+    if (spdlog::should_log(spdlog::level::trace)) { // dump() is evaluated before the level check otherwise
+        spdlog::trace("  -> Serialized connectionInfo: {}", j_conn.dump());
+    }
     return j_conn;
 }
 json AudioPlug::serializeDestConnectionInfo() const {
@@ -50,7 +52,9 @@ json AudioPlug::serializeDestConnectionInfo() const {
                                  json("None(0xFF)") : json(destConnectionInfo_->streamPosition0);
     j_dest["streamPosition1"] = (destConnectionInfo_->streamPosition1 == 0xFF) ?
                                  json("None(0xFF)") : json(destConnectionInfo_->streamPosition1);
-    spdlog::trace("  -> Serialized destConnectionInfo: {}", j_dest.dump());
+    if (spdlog::should_log(spdlog::level::trace)) { // dump() is evaluated before the level check otherwise
+        spdlog::trace("  -> Serialized destConnectionInfo: {}", j_dest.dump());
+    }
     return j_dest;
 }
 void AudioPlug::setConnectionInfo(ConnectionInfo info) {
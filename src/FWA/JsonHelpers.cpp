@@ -78,11 +78,14 @@ namespace FWA::JsonHelpers {
     }
     json serializeHexBytes(const std::vector<uint8_t>& bytes) {
         if (bytes.empty()) return nullptr;
-        std::ostringstream oss;
-        oss << std::hex << std::uppercase << std::setfill('0');
-        for (const auto& byte : bytes) {
-            oss << std::setw(2) << static_cast<int>(byte);
+        // Descriptor dumps can be hundreds of bytes; fill the string from a digit table
+        // rather than pushing every byte through iostream formatting.
+        static constexpr char kHexDigits[] = "0123456789ABCDEF";
+        std::string hex(bytes.size() * 2, '0');
+        for (size_t i = 0; i < bytes.size(); ++i) {
+            hex[2 * i]     = kHexDigits[bytes[i] >> 4];
+            hex[2 * i + 1] = kHexDigits[bytes[i] & 0x0F];
         }
-        return oss.str();
+        return hex;
     }
 }
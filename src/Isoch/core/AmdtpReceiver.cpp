@@ -14,11 +14,10 @@
 #include <mach/mach_time.h>                // For mach_absolute_time
 #include <time.h>                          // For clock_gettime_nsec_np
 #include <unistd.h>
+#include <algorithm>                       // For std::min
 // to_hex for spdlog
 #include <spdlog/fmt/bin_to_hex.h>
 
-#include "Isoch/utils/RingBuffer.hpp"
-
 namespace FWA {
 namespace Isoch {
 
@@ -488,10 +487,13 @@ void AmdtpReceiver::handleProcessedData(const std::vector<ProcessedSample>& samp
         if (pll_->isInitialized()) {
             if (logger_) logger_->trace("Writing {} samples to App Ring Buffer. First AbsIdx: {}", samples.size(), samples[0].absoluteSampleIndex);
 
-            ProcessedAudioFrame frame; // Reuse frame struct
+            // Assemble the packet's frames first, then hand them to the ring buffer in one write
+            ringFrames_.clear();
+            ringFrames_.reserve(samples.size());
             for (const auto& sample : samples) {
                 // Calculate presentation time using the PLL
                 // This now happens *inside* the loop for potentially better accuracy per frame
+                ProcessedAudioFrame frame;
                 frame.presentationNanos = pll_->getPresentationTimeNs(sample.absoluteSampleIndex);
 
                 // Check for valid timestamp (e.g., PLL might return 0 if it can't estimate yet)
@@ -503,14 +505,18 @@ void AmdtpReceiver::handleProcessedData(const std::vector<ProcessedSample>& samp
                 // Assemble the rest of the frame
                 frame.sampleL = sample.sampleL;
                 frame.sampleR = sample.sampleR;
+                ringFrames_.push_back(frame);
+            }
 
-                // Write frame to appRingBuffer_
-                size_t written = appRingBuffer_->write(sizeof(frame), &frame);
-                if (written != sizeof(frame)) {
-                     if (logger_) logger_->error("Failed to write complete frame (AbsIdx {}) to ring buffer! Buffer full?", sample.absoluteSampleIndex);
-                     // Handle ring buffer full - break is reasonable for now
-                     break;
-                }
+            // Write as many whole frames as fit; the rest are dropped as before
+            size_t framesToWrite = std::min<size_t>(ringFrames_.size(),
+                                                    appRingBuffer_->write_space() / sizeof(ProcessedAudioFrame));
+            if (framesToWrite > 0) {
+                appRingBuffer_->write(static_cast<uint32_t>(framesToWrite * sizeof(ProcessedAudioFrame)), ringFrames_.data());
+            }
+            if (framesToWrite < ringFrames_.size()) {
+                 if (logger_) logger_->error("Failed to write {} of {} frames to ring buffer! Buffer full?",
+                                             ringFrames_.size() - framesToWrite, ringFrames_.size());
             }
              if (logger_ && !samples.empty()) logger_->trace("Finished writing samples. Last AbsIdx: {}", samples.back().absoluteSampleIndex);
 
@@ -547,34 +553,21 @@ void AmdtpReceiver::handleBufferGroupComplete(uint32_t groupIndex) {
     // logger_->info("*** PROCESSING GROUP {} ***", groupIndex);
 
     const uint32_t packetsInGroup = bufferManager_->getPacketsPerGroup();
-    const size_t expectedTotalPacketSize = bufferManager_->getTotalPacketSize(); // Get expected total packet size
+    const uint32_t dataSize = bufferManager_->getPacketDataSize(); // Same for every packet slot
 
     // Process all packets within this completed group
     for (uint32_t packetIdx = 0; packetIdx < packetsInGroup && running_; ++packetIdx) {
-        // --- Get Raw Packet Pointer and Log Raw Data ---
-        auto rawPacketPtrExp = bufferManager_->getRawPacketSlotPtr(groupIndex, packetIdx);
+        // --- Get Timestamp Pointer ---
         auto tsPtrExp = bufferManager_->getPacketTimestampPtr(groupIndex, packetIdx);
 
-        if (!rawPacketPtrExp || !tsPtrExp) {
-            logger_->error("Failed to get raw pointers for G:{} P:{}", groupIndex, packetIdx);
+        if (!tsPtrExp) {
+            logger_->error("Failed to get timestamp pointer for G:{} P:{}", groupIndex, packetIdx);
             continue;
         }
 
-        uint8_t* rawPacketPtr = rawPacketPtrExp.value();
         uint32_t timestamp = *tsPtrExp.value(); // Get timestamp
 
-        // Determine how much data to dump (avoid reading past buffer end if possible)
-        size_t dumpSize = std::min((size_t)80, expectedTotalPacketSize); // Dump up to 80 bytes or expected size
-
-        std::vector<uint8_t> raw_packet_bytes(dumpSize);
-        std::memcpy(raw_packet_bytes.data(), rawPacketPtr, dumpSize);
-
-//        logger_->debug("Raw Packet G:{} P:{} @ {:p} (Expected Size: {}):",
-//                      groupIndex, packetIdx, (void*)rawPacketPtr, expectedTotalPacketSize);
-//        logger_->debug("  Hex Dump ({} bytes): {}", dumpSize, spdlog::to_hex(raw_packet_bytes));
-//        // --- End Raw Logging ---
-
-        // --- Now, get the separated pointers as before for processing ---
+        // --- Get the separated pointers for processing ---
         auto isochHdrPtrExp = bufferManager_->getPacketIsochHeaderPtr(groupIndex, packetIdx);
         auto cipHdrPtrExp = bufferManager_->getPacketCIPHeaderPtr(groupIndex, packetIdx);
         auto dataPtrExp = bufferManager_->getPacketDataPtr(groupIndex, packetIdx);
@@ -589,7 +582,6 @@ void AmdtpReceiver::handleBufferGroupComplete(uint32_t groupIndex) {
         auto isochHdrPtr = isochHdrPtrExp.value();
         auto cipHdrPtr = cipHdrPtrExp.value();
         auto dataPtr = dataPtrExp.value();
-        uint32_t dataSize = bufferManager_->getPacketDataSize();
 
         // Process packet with the separated data
         auto procResult = packetProcessor_->processPacket(
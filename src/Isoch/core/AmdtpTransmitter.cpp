@@ -8,6 +8,7 @@
 #include <CoreServices/CoreServices.h> // For endian swap
 #include <vector>
 #include <chrono> // For timing/sleep 
+#include <iterator> // For std::size
 
 namespace FWA {
 namespace Isoch {
@@ -57,6 +58,12 @@ std::expected<void, IOKitError> AmdtpTransmitter::startTransmit() {
         logger_->debug("Performing initial memory preparation for DCL ring...");
         uint32_t totalPacketsToPrep = config_.numGroups * config_.packetsPerGroup;
 
+        // Fixed for the whole stream; look them up once rather than per packet
+        const uint8_t fwChannel = portChannelManager_->getActiveChannel().value_or(config_.initialChannel & 0x3F);
+        uint8_t* clientAudioBuffer = bufferManager_->getClientAudioBufferPtr();
+        const size_t clientAudioBufferSize = bufferManager_->getClientAudioBufferSize();
+        const size_t audioPayloadTargetSize = bufferManager_->getAudioPayloadSizePerPacket();
+
         for (uint32_t absPktIdx = 0; absPktIdx < totalPacketsToPrep; ++absPktIdx) {
             uint32_t g = absPktIdx / config_.packetsPerGroup;
             uint32_t p = absPktIdx % config_.packetsPerGroup;
@@ -64,9 +71,8 @@ std::expected<void, IOKitError> AmdtpTransmitter::startTransmit() {
             // --- 2a. Get Buffer Pointers ---
             auto cipHdrPtrExp = bufferManager_->getPacketCIPHeaderPtr(g, p);
             uint8_t* audioDataTargetPtr = nullptr;
-            if(bufferManager_->getClientAudioBufferPtr() && bufferManager_->getClientAudioBufferSize() > 0) {
-               audioDataTargetPtr = bufferManager_->getClientAudioBufferPtr()
-                               + (absPktIdx * bufferManager_->getAudioPayloadSizePerPacket()) % bufferManager_->getClientAudioBufferSize();
+            if(clientAudioBuffer && clientAudioBufferSize > 0) {
+               audioDataTargetPtr = clientAudioBuffer + (absPktIdx * audioPayloadTargetSize) % clientAudioBufferSize;
             }
             auto isochHdrPtrExp = bufferManager_->getPacketIsochHeaderPtr(g, p); // For template update
 
@@ -78,7 +84,6 @@ std::expected<void, IOKitError> AmdtpTransmitter::startTransmit() {
                 break;
             }
             CIPHeader* cipHdrTarget = reinterpret_cast<CIPHeader*>(cipHdrPtrExp.value());
-            size_t audioPayloadTargetSize = bufferManager_->getAudioPayloadSizePerPacket();
             IsochHeaderData* isochHdrTarget = reinterpret_cast<IsochHeaderData*>(isochHdrPtrExp.value());
 
             // --- 2b. Fill Audio Payload (Initial Silence) ---
@@ -95,7 +100,6 @@ std::expected<void, IOKitError> AmdtpTransmitter::startTransmit() {
 
             // --- 2d. Prepare Isoch Header Template ---
             // Set the channel, tag, tcode in the template memory
-            uint8_t fwChannel = portChannelManager_->getActiveChannel().value_or(config_.initialChannel & 0x3F);
             // Calculate expected data_length (CIP + Payload, even if payload is silence for now)
             uint16_t dataLength = kTransmitCIPHeaderSize + audioPayloadTargetSize;
             isochHdrTarget->data_length = OSSwapHostToBigInt16(dataLength); // HW might overwrite if ranges differ
@@ -286,6 +290,12 @@ void AmdtpTransmitter::handleDCLComplete(uint32_t completedGroupIndex) {
 
 
     // --- 4. Prepare Next Segment Loop ---
+    // Channel and buffer geometry don't change mid-stream; query them once per callback, not per packet
+    const uint8_t fwChannel = portChannelManager_->getActiveChannel().value_or(config_.initialChannel & 0x3F);
+    uint8_t* clientAudioBuffer = bufferManager_->getClientAudioBufferPtr();
+    const size_t clientAudioBufferSize = bufferManager_->getClientAudioBufferSize();
+    const size_t audioPayloadTargetSize = bufferManager_->getAudioPayloadSizePerPacket();
+
     // Iterate through all packets within the 'fillGroupIndex' segment
     for (uint32_t p = 0; p < config_.packetsPerGroup; ++p) {
         uint32_t absolutePacketIndex = fillGroupIndex * config_.packetsPerGroup + p;
@@ -296,9 +306,8 @@ void AmdtpTransmitter::handleDCLComplete(uint32_t completedGroupIndex) {
         auto cipHdrPtrExp = bufferManager_->getPacketCIPHeaderPtr(fillGroupIndex, p);
         // Pointer to where the *provider* writes audio data in DMA memory
         uint8_t* audioDataTargetPtr = nullptr;
-         if(bufferManager_->getClientAudioBufferPtr() && bufferManager_->getClientAudioBufferSize() > 0) {
-            audioDataTargetPtr = bufferManager_->getClientAudioBufferPtr()
-                           + (absolutePacketIndex * bufferManager_->getAudioPayloadSizePerPacket()) % bufferManager_->getClientAudioBufferSize();
+         if(clientAudioBuffer && clientAudioBufferSize > 0) {
+            audioDataTargetPtr = clientAudioBuffer + (absolutePacketIndex * audioPayloadTargetSize) % clientAudioBufferSize;
          }
 
         if (!isochHdrPtrExp || !cipHdrPtrExp || !audioDataTargetPtr) {
@@ -308,7 +317,6 @@ void AmdtpTransmitter::handleDCLComplete(uint32_t completedGroupIndex) {
         
         IsochHeaderData* isochHdrTarget = reinterpret_cast<IsochHeaderData*>(isochHdrPtrExp.value());
         CIPHeader* cipHdrTarget = reinterpret_cast<CIPHeader*>(cipHdrPtrExp.value());
-        size_t audioPayloadTargetSize = bufferManager_->getAudioPayloadSizePerPacket();
 
 
         // --- 4b. Prepare TransmitPacketInfo ---
@@ -351,7 +359,6 @@ void AmdtpTransmitter::handleDCLComplete(uint32_t completedGroupIndex) {
 
         // --- 4e. Update Isoch Header ---
         // Update Isoch header template with appropriate data_length, channel, etc.
-        uint8_t fwChannel = portChannelManager_->getActiveChannel().value_or(config_.initialChannel & 0x3F);
         isochHdrTarget->data_length = OSSwapHostToBigInt16(kTransmitCIPHeaderSize + packetDataStatus.dataLength);
         isochHdrTarget->tag_channel = (1 << 6) | (fwChannel & 0x3F);
         isochHdrTarget->tcode_sy = (0xA << 4) | 0; // TCode=0xA (Isoch Data Block)
@@ -582,6 +589,24 @@ void AmdtpTransmitter::initializeCIPState() {
 
      firstDCLCallbackOccurred_ = false;
      expectedTimeStampCycle_ = 0;
+
+     // --- Determine SFC from config (fixed for the duration of the stream) ---
+     // IEC 61883-6 SFC codes 0x01 (44.1kHz) ... 0x06 (192kHz); code = table index + 1
+     static constexpr double kSfcSampleRates[] = {44100.0, 48000.0, 88200.0, 96000.0, 176400.0, 192000.0};
+     sfc_ = 0xFF;
+     for (uint8_t i = 0; i < std::size(kSfcSampleRates); ++i) {
+         if (config_.sampleRate == kSfcSampleRates[i]) {
+             sfc_ = static_cast<uint8_t>(i + 1);
+             break;
+         }
+     }
+     if (sfc_ == 0xFF) {
+         logger_->warn("initializeCIPState: Unsupported sample rate {:.1f}Hz, using SFC for 48kHz.", config_.sampleRate);
+         sfc_ = 0x02; // Fallback
+     }
+
+     // --- DBC increment per DATA packet (fixed by the buffer layout) ---
+     dbcIncrement_ = bufferManager_ ? static_cast<uint8_t>(bufferManager_->getAudioPayloadSizePerPacket() / 8) : 0; // 64/8 = 8 blocks typically
 }
 
 // prepareCIPHeader
@@ -589,22 +614,6 @@ void AmdtpTransmitter::prepareCIPHeader(CIPHeader* outHeader) {
     // logger_->trace("AmdtpTransmitter::prepareCIPHeader()");
     if (!outHeader || !portChannelManager_ || !bufferManager_) { /* error */ return; }
 
-    // --- Get Node ID, SFC, Set static fields ---
-    uint16_t nodeID = portChannelManager_->getLocalNodeID().value_or(0x3F); // Default to local node ID
-
-    // --- Determine SFC from config ---
-    uint8_t sfc = 0x00; // Default 32kHz
-    if (config_.sampleRate == 44100.0) sfc = 0x01;      // SFC for 44.1kHz
-    else if (config_.sampleRate == 48000.0) sfc = 0x02; // SFC for 48kHz
-    else if (config_.sampleRate == 88200.0) sfc = 0x03; // SFC for 88.2kHz
-    else if (config_.sampleRate == 96000.0) sfc = 0x04; // SFC for 96kHz
-    else if (config_.sampleRate == 176400.0) sfc = 0x05; // SFC for 176.4kHz
-    else if (config_.sampleRate == 192000.0) sfc = 0x06; // SFC for 192kHz
-    else {
-        logger_->warn("prepareCIPHeader: Unsupported sample rate {:.1f}Hz, using SFC for 48kHz.", config_.sampleRate);
-        sfc = 0x02; // Fallback
-    }
-
     // --- Set static fields ---
     outHeader->sid_byte = 0; // Assuming HW/Port sets SID correctly
     outHeader->dbs = 2;      // AM824 Stereo (8 bytes/4 = 2)
@@ -656,13 +665,11 @@ void AmdtpTransmitter::prepareCIPHeader(CIPHeader* outHeader) {
         // DBC: Repeat the previous DBC value if sending NO_DATA
         outHeader->dbc = dbc_count_;
     } else {
-        outHeader->fdf = sfc; // FDF for the specific sample rate
+        outHeader->fdf = sfc_; // FDF for the specific sample rate (set in initializeCIPState)
         outHeader->syt = OSSwapHostToBigInt16(calculated_sytVal); // Calculated SYT value
         // DBC: Increment only if the *previous* packet was *not* NO_DATA
-        uint8_t blocksPerPacket = bufferManager_->getAudioPayloadSizePerPacket() / 8; // 64/8 = 8 blocks typically
-        uint8_t increment = blocksPerPacket;
         // Use wasNoData_ (state *before* this packet)
-        uint8_t next_dbc = wasNoData_ ? dbc_count_ : (dbc_count_ + increment);
+        uint8_t next_dbc = wasNoData_ ? dbc_count_ : (dbc_count_ + dbcIncrement_);
         outHeader->dbc = next_dbc & 0xFF;
     }
     // --- End Set Dynamic Fields ---
@@ -31,6 +31,7 @@ AudioClockPLL::~AudioClockPLL() {
 void AudioClockPLL::setSampleRate(double rate) {
     if (rate > 0) {
         targetSampleRate_ = rate;
+        updateDerivedRates();
         if (logger_) logger_->info("PLL Target Sample Rate set to: {:.2f} Hz", targetSampleRate_);
         // Optionally reset PLL state when rate changes?
         // resetState();
@@ -60,6 +61,14 @@ void AudioClockPLL::initializeHostClockInfo() {
     }
     if (logger_) logger_->debug("PLL Host Clock Info: Rate ~{} ticks/sec, {}/{} ns ratio",
                                 hostTicksPerSecond_, timebaseInfo_.numer, timebaseInfo_.denom);
+    updateDerivedRates();
+}
+
+void AudioClockPLL::updateDerivedRates() {
+    // Only changes with the sample rate or timebase; the per-packet/per-frame paths read the cached values.
+    double hostTicksPerSec = static_cast<double>(NANOS_PER_SECOND * timebaseInfo_.denom) / timebaseInfo_.numer;
+    hostTicksPerSampleNominal_ = hostTicksPerSec / targetSampleRate_;
+    fwTicksPerSampleNominal_ = fwClock_NominalRateHz_ / targetSampleRate_;
 }
 
 void AudioClockPLL::resetState() {
@@ -138,8 +147,7 @@ void AudioClockPLL::update(const PacketTimingInfo& timing, uint64_t currentHostT
         if (timing.firstAbsSampleIndex < lastSYT_AbsSampleIndex_) { /* Handle wrap */ samplesSinceLastSYT = 0; }
 
         if (samplesSinceLastSYT > 0 && targetSampleRate_ > 0) {
-            double expectedFwTicksForSamples = (static_cast<double>(samplesSinceLastSYT) / targetSampleRate_)
-                                               * fwClock_NominalRateHz_;
+            double expectedFwTicksForSamples = static_cast<double>(samplesSinceLastSYT) * fwTicksPerSampleNominal_;
 
             int32_t fwTicksBetweenSYTs = static_cast<int32_t>(timing.fwTimestamp - lastSYT_FWTimestamp_);
             const int32_t oneSecondTicks = static_cast<int32_t>(fwClock_NominalRateHz_);
@@ -232,13 +240,10 @@ uint64_t AudioClockPLL::getPresentationTimeNs(uint64_t absoluteSampleIndex) {
     }
     // Host Ticks = Samples * (HostTicks/Sec) / (Samples/Sec * Ratio)
     // Ratio = DeviceRate / HostRate => Host Ticks = Samples * HostTicksPerSec / (DeviceRate) = Samples * HostTicksPerSample / Ratio
-    double hostTicksPerSec = static_cast<double>(NANOS_PER_SECOND * timebaseInfo_.denom) / timebaseInfo_.numer;
-    double hostTicksPerSample_Nominal = hostTicksPerSec / targetSampleRate_;
-
     // Adjust expected host ticks based on the current clock ratio estimate
     // If currentRatio_ > 1 (device faster), we need *fewer* host ticks per device sample.
     // If currentRatio_ < 1 (device slower), we need *more* host ticks per device sample.
-    double estimatedHostTickDelta = static_cast<double>(samplesSinceAnchor) * hostTicksPerSample_Nominal / currentRatio_;
+    double estimatedHostTickDelta = static_cast<double>(samplesSinceAnchor) * hostTicksPerSampleNominal_ / currentRatio_;
 
     uint64_t estimatedHostTimeAbs = anchorHostTimeAbs + static_cast<uint64_t>(estimatedHostTickDelta);
 
@@ -9,10 +9,20 @@
 constexpr size_t BYTES_PER_AM824_SAMPLE = 4;
 // Define max value for 24-bit signed int normalization
 constexpr float MAX_24BIT_SIGNED_FLOAT = 8388607.0f; // 2^23 - 1
+constexpr float INV_MAX_24BIT_SIGNED_FLOAT = 1.0f / MAX_24BIT_SIGNED_FLOAT;
     // Define common header sizes for reference
 constexpr size_t kIsochHeaderSize = 4;
 constexpr size_t kCIPHeaderSize = 8;
 
+// Decode one big-endian AM824 quadlet to a normalized float.
+// Shifting the label byte out and arithmetic-shifting back sign-extends the 24-bit value without a branch.
+static inline float decodeAM824Sample(const uint8_t* src) {
+    uint32_t am824_be;
+    std::memcpy(&am824_be, src, sizeof(uint32_t));
+    int32_t sample24 = static_cast<int32_t>(OSSwapBigToHostInt32(am824_be) << 8) >> 8;
+    return static_cast<float>(sample24) * INV_MAX_24BIT_SIGNED_FLOAT;
+}
+
 namespace FWA {
 namespace Isoch {
 
@@ -40,6 +50,21 @@ void IsochPacketProcessor::setOverrunCallback(OverrunCallback callback, void* re
     overrunCallbackRefCon_ = refCon;
 }
 
+void IsochPacketProcessor::signalPLLInit(uint32_t fwTimestamp, uint16_t syt, uint8_t dbc, uint8_t fdf, uint8_t sfc) {
+    if (!processedDataCallback_ || syt == 0xFFFF) return; // Only if callback set and SYT valid
+    PacketTimingInfo initTiming = {
+        .fwTimestamp = fwTimestamp,
+        .syt = syt,
+        .firstDBC = dbc,
+        .numSamplesInPacket = 0, // Pass 0 samples for init
+        .fdf = fdf,
+        .sfc = sfc,
+        .firstAbsSampleIndex = 0
+    };
+    static const std::vector<ProcessedSample> kNoSamples;
+    processedDataCallback_(kNoSamples, initTiming, processedDataCallbackRefCon_); // Signal for PLL init
+}
+
 std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
     uint32_t groupIndex,
     uint32_t packetIndexInGroup,
@@ -55,15 +80,14 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
 
     if (logger_ && logger_->should_log(spdlog::level::trace)) { // Reduce log spam slightly
         // --- Log Raw Headers ---
-        std::vector<uint8_t> raw_iso(kIsochHeaderSize);
-        std::memcpy(raw_iso.data(), isochHeader, kIsochHeaderSize);
+        // to_hex formats straight from the DCL buffer; no need to copy the headers out first
         logger_->trace("Packet G:{} P:{} - Raw Isoch Header @ {:p}: {}",
-                      groupIndex, packetIndexInGroup, (void*)isochHeader, spdlog::to_hex(raw_iso));
+                      groupIndex, packetIndexInGroup, (void*)isochHeader,
+                      spdlog::to_hex(isochHeader, isochHeader + kIsochHeaderSize));
 
-        std::vector<uint8_t> raw_cip(kCIPHeaderSize);
-        std::memcpy(raw_cip.data(), cipHeader, kCIPHeaderSize);
         logger_->trace("Packet G:{} P:{} - Raw CIP Header @ {:p}: {}",
-                      groupIndex, packetIndexInGroup, (void*)cipHeader, spdlog::to_hex(raw_cip));
+                      groupIndex, packetIndexInGroup, (void*)cipHeader,
+                      spdlog::to_hex(cipHeader, cipHeader + kCIPHeaderSize));
         logger_->trace("Packet G:{} P:{} - Packet Data @ {:p}, Length: {}",
                       groupIndex, packetIndexInGroup, (void*)packetData, packetDataLength);
         logger_->trace("Packet G:{} P:{} - FW Timestamp: {:#010x} ({})",
@@ -95,6 +119,7 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
     uint8_t fmt = (cip1 >> 24) & 0x3F; // Format ID
     uint8_t fdf = (cip1 >> 16) & 0xFF; // Format Dependent Field
     uint16_t syt = cip1 & 0xFFFF;      // SYT field
+    const uint8_t sfc = getSFCFromFDF(fdf); // Stream format, decoded once for all timing infos below
 
     if (logger_) logger_->trace("Packet G:{} P:{} - Parsed CIP: SID={}, DBS={}, DBC={}, FMT={:#x}, FDF={:#x}, SYT={:#06x}",
                                groupIndex, packetIndexInGroup, sid, dbs, dbc, fmt, fdf, syt);
@@ -103,10 +128,9 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
     const uint8_t EXPECTED_FMT = 0x10;
     if (fmt != EXPECTED_FMT) {
         if (logger_) {
-            std::vector<uint8_t> cip_bytes(8);
-            std::memcpy(cip_bytes.data(), cipHeader, 8);
             logger_->warn("Packet G:{} P:{} - Unexpected CIP FMT: {:#04x} (Expected {:#04x}). Full CIP Header (BE): {}",
-                          groupIndex, packetIndexInGroup, fmt, EXPECTED_FMT, spdlog::to_hex(cip_bytes));
+                          groupIndex, packetIndexInGroup, fmt, EXPECTED_FMT,
+                          spdlog::to_hex(cipHeader, cipHeader + kCIPHeaderSize));
         }
         return {}; // Skip non-AMDTP packets
     }
@@ -157,8 +181,8 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
     //                            groupIndex, packetIndexInGroup, dbs_bytes, samplesPerBlock, numDataBlocks, totalSamplesInPacket);
 
     // --- State for callback ---
-    std::vector<ProcessedSample> packetSamples;
-    packetSamples.reserve(totalSamplesInPacket / 2); // Reserve for stereo frames
+    packetSamples_.clear(); // Keeps capacity, so steady-state packets don't allocate
+    packetSamples_.reserve(totalSamplesInPacket / 2); // Reserve for stereo frames
     uint64_t packetStartAbsSampleIndex = 0; // Will be set later
     bool discontinuityDetected = false;
 
@@ -188,37 +212,19 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
                 if (logger_) logger_->info("Packet G:{} P:{} - Initialized absolute sample index to 0", groupIndex, packetIndexInGroup);
                 
                 // Initialize PLL here using fwTimestamp and SYT (if valid)
-                if (processedDataCallback_ && syt != 0xFFFF) { // Only if callback set and SYT valid
-                    PacketTimingInfo initTiming = { 
-                        .fwTimestamp = fwTimestamp,
-                        .syt = syt,
-                        .firstDBC = dbc, 
-                        .numSamplesInPacket = 0, // Pass 0 samples for init
-                        .fdf = fdf,
-                        .sfc = getSFCFromFDF(fdf),
-                        .firstAbsSampleIndex = 0
-                    };
-                    std::vector<ProcessedSample> emptySamples;
-                    processedDataCallback_(emptySamples, initTiming, processedDataCallbackRefCon_); // Signal for PLL init
-                }
+                signalPLLInit(fwTimestamp, syt, dbc, fdf, sfc);
             }
         }
     } else {
         // --- Subsequent Packet Processing ---
-        uint8_t nextExpectedDBC;
-
         // --- Calculate Correct Expectation ---
-        if (lastPacketWasNoData_) {
-            // If previous was NO_DATA, expect the SAME DBC it carried
-            nextExpectedDBC = expectedDBC_;
-            if (logger_) logger_->trace("Packet G:{} P:{} - Expecting SAME DBC {} (after NO_DATA)", 
-                                       groupIndex, packetIndexInGroup, nextExpectedDBC);
-        } else {
-            // If previous was DATA, expect DBC + blocks from previous DATA packet
-            nextExpectedDBC = (expectedDBC_ + lastPacketNumDataBlocks_) & 0xFF;
-            if (logger_) logger_->trace("Packet G:{} P:{} - Expecting DBC {} + {} = {} (after DATA)", 
-                                       groupIndex, packetIndexInGroup, expectedDBC_, lastPacketNumDataBlocks_, nextExpectedDBC);
-        }
+        // After NO_DATA the next packet carries the SAME DBC; after DATA it advances by the
+        // previous packet's block count. uint8_t arithmetic gives the mod-256 wrap for free.
+        const uint8_t dbcAdvance = lastPacketWasNoData_ ? 0 : static_cast<uint8_t>(lastPacketNumDataBlocks_);
+        const uint8_t nextExpectedDBC = static_cast<uint8_t>(expectedDBC_ + dbcAdvance);
+        if (logger_) logger_->trace("Packet G:{} P:{} - Expecting DBC {} + {} = {} (after {})",
+                                   groupIndex, packetIndexInGroup, expectedDBC_, dbcAdvance, nextExpectedDBC,
+                                   (lastPacketWasNoData_ ? "NO_DATA" : "DATA"));
 
         // --- Compare Received DBC with Expectation ---
         if (dbc != nextExpectedDBC) {
@@ -249,27 +255,21 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
                 }
             }
 
-            // --- RESYNC State based on CURRENT packet ---
-            expectedDBC_ = dbc;                       // Base NEXT expectation on THIS packet's DBC
-            lastPacketNumDataBlocks_ = numDataBlocks;  // Use blocks from THIS packet
-            lastPacketWasNoData_ = currentPacketIsNoData; // Store type of THIS packet
             discontinuityDetected = true;
-            // if (logger_) logger_->debug("Packet G:{} P:{} - RESYNC state: Next expected after PrevDBC={}, PrevBlocks={}, PrevWasNoData={}",
-            //                             groupIndex, packetIndexInGroup, expectedDBC_, lastPacketNumDataBlocks_, lastPacketWasNoData_);
-
         } else {
             // --- DBC OK ---
             if (logger_) logger_->trace("Packet G:{} P:{} ({}) - DBC OK (Expected {})",
                                         groupIndex, packetIndexInGroup, (currentPacketIsNoData?"NO_DATA":"DATA"), nextExpectedDBC);
-
-            // --- Update state based on CURRENT packet for NEXT check ---
-            expectedDBC_ = dbc;                        // Base NEXT expectation on THIS packet's DBC
-            lastPacketNumDataBlocks_ = numDataBlocks;   // Use blocks from THIS packet
-            lastPacketWasNoData_ = currentPacketIsNoData; // Store type of THIS packet
-            if (logger_) logger_->trace("Packet G:{} P:{} - Updated state for next check: Next expected after PrevDBC={}, PrevBlocks={}, PrevWasNoData={}",
-                                        groupIndex, packetIndexInGroup, expectedDBC_, lastPacketNumDataBlocks_, lastPacketWasNoData_);
         }
 
+        // --- Update (or RESYNC) state based on CURRENT packet for NEXT check ---
+        // Same in both cases: the next expectation is always based on THIS packet.
+        expectedDBC_ = dbc;                        // Base NEXT expectation on THIS packet's DBC
+        lastPacketNumDataBlocks_ = numDataBlocks;   // Use blocks from THIS packet
+        lastPacketWasNoData_ = currentPacketIsNoData; // Store type of THIS packet
+        if (logger_) logger_->trace("Packet G:{} P:{} - Updated state for next check: Next expected after PrevDBC={}, PrevBlocks={}, PrevWasNoData={}",
+                                    groupIndex, packetIndexInGroup, expectedDBC_, lastPacketNumDataBlocks_, lastPacketWasNoData_);
+
         // Set start sample index for potential processing
         packetStartAbsSampleIndex = currentAbsSampleIndex_;
 
@@ -282,24 +282,22 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
                                       groupIndex, packetIndexInGroup);
                 
             // Initialize PLL here using fwTimestamp and SYT (if valid)
-            if (processedDataCallback_ && syt != 0xFFFF) { // Only if callback set and SYT valid
-                PacketTimingInfo initTiming = { 
-                    .fwTimestamp = fwTimestamp,
-                    .syt = syt,
-                    .firstDBC = dbc, 
-                    .numSamplesInPacket = 0, // Pass 0 samples for init
-                    .fdf = fdf,
-                    .sfc = getSFCFromFDF(fdf),
-                    .firstAbsSampleIndex = 0
-                };
-                std::vector<ProcessedSample> emptySamples;
-                processedDataCallback_(emptySamples, initTiming, processedDataCallbackRefCon_); // Signal for PLL init
-            }
+            signalPLLInit(fwTimestamp, syt, dbc, fdf, sfc);
         }
     } // End if (Subsequent Packet)
 
     // --- 6. Process Samples (Only for DATA packets) ---
-    if (!currentPacketIsNoData && totalSamplesInPacket > 0) {
+    if (!currentPacketIsNoData && totalSamplesInPacket > 0 && samplesPerBlock == 2) {
+        // Fast path for the common DBS=2 (plain stereo) stream: one L/R pair per block,
+        // fixed 8-byte stride and one frame index per block, no inner loop or odd-sample check.
+        const uint8_t* blockPtr = packetData;
+        for (uint32_t blockIdx = 0; blockIdx < numDataBlocks; ++blockIdx, blockPtr += 2 * BYTES_PER_AM824_SAMPLE) {
+            packetSamples_.push_back({decodeAM824Sample(blockPtr),
+                                      decodeAM824Sample(blockPtr + BYTES_PER_AM824_SAMPLE),
+                                      packetStartAbsSampleIndex + blockIdx});
+        }
+        currentAbsSampleIndex_ += numDataBlocks;
+    } else if (!currentPacketIsNoData && totalSamplesInPacket > 0) {
         for (uint32_t blockIdx = 0; blockIdx < numDataBlocks; ++blockIdx) {
             const uint8_t* blockPtr = packetData + (blockIdx * dbs_bytes);
             uint8_t currentBlockDBC = (dbc + blockIdx) & 0xFF; // DBC for this specific block
@@ -313,23 +311,11 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
 
                 uint64_t frameAbsSampleIndex = packetStartAbsSampleIndex + (blockIdx * samplesPerBlock + sampleIdx) / 2;
 
-                // Extract Left Sample (AM824 format)
-                uint32_t am824_be_L;
-                std::memcpy(&am824_be_L, blockPtr + (sampleIdx * BYTES_PER_AM824_SAMPLE), sizeof(uint32_t));
-                uint32_t am824_le_L = OSSwapBigToHostInt32(am824_be_L); // To Host Endian
-                int32_t sample24_L = am824_le_L & 0x00FFFFFF;
-                if (sample24_L & 0x00800000) { sample24_L |= 0xFF000000; }
-                float sampleFloatL = static_cast<float>(sample24_L) / MAX_24BIT_SIGNED_FLOAT;
-
-                // Extract Right Sample
-                uint32_t am824_be_R;
-                std::memcpy(&am824_be_R, blockPtr + ((sampleIdx + 1) * BYTES_PER_AM824_SAMPLE), sizeof(uint32_t));
-                uint32_t am824_le_R = OSSwapBigToHostInt32(am824_be_R);
-                int32_t sample24_R = am824_le_R & 0x00FFFFFF;
-                if (sample24_R & 0x00800000) { sample24_R |= 0xFF000000; }
-                float sampleFloatR = static_cast<float>(sample24_R) / MAX_24BIT_SIGNED_FLOAT;
-
-                packetSamples.push_back({sampleFloatL, sampleFloatR, frameAbsSampleIndex});
+                // Extract Left/Right Samples (AM824 format)
+                float sampleFloatL = decodeAM824Sample(blockPtr + (sampleIdx * BYTES_PER_AM824_SAMPLE));
+                float sampleFloatR = decodeAM824Sample(blockPtr + ((sampleIdx + 1) * BYTES_PER_AM824_SAMPLE));
+
+                packetSamples_.push_back({sampleFloatL, sampleFloatR, frameAbsSampleIndex});
             }
         }
         // Increment absolute sample counter AFTER processing samples
@@ -346,14 +332,14 @@ std::expected<void, IOKitError> IsochPacketProcessor::processPacket(
         .firstDBC = dbc, // DBC of the first block in *this* packet
         .numSamplesInPacket = totalSamplesInPacket,
         .fdf = fdf,
-        .sfc = getSFCFromFDF(fdf),
+        .sfc = sfc,
         .firstAbsSampleIndex = packetStartAbsSampleIndex // Start index for samples in *this* packet
     };
 
     // --- 8. Send data upstream ---
     if (processedDataCallback_) {
         // Call with samples (even if empty for NO_DATA packets or on discontinuity)
-        processedDataCallback_(packetSamples, timingInfo, processedDataCallbackRefCon_);
+        processedDataCallback_(packetSamples_, timingInfo, processedDataCallbackRefCon_);
     } else if (logger_) {
         logger_->warn("Packet G:{} P:{} - No processed data callback set!", groupIndex, packetIndexInGroup);
     }